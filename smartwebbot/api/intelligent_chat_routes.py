@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from typing import Dict, List, Optional, Any
 import asyncio
 import logging
+import threading
 
 from ..intelligence.intelligent_chat_orchestrator import IntelligentChatOrchestrator
 from ..intelligence.dynamic_credential_manager import DynamicCredentialManager, CredentialType
@@ -22,6 +23,11 @@ chat_orchestrator = None
 credential_manager = None
 web_search = None
 
+# Fallback ChatAI config whose provider initialized successfully. Each request
+# gets its own ChatAI built from it, so conversation history isn't shared.
+fallback_ai_config = None
+_fallback_ai_lock = threading.Lock()
+
 router = APIRouter(prefix="/api/intelligent-chat", tags=["intelligent-chat"])
 
 
@@ -123,6 +129,32 @@ async def initialize_intelligent_chat():
         web_search = None
 
 
+def _get_fallback_ai():
+    """Get a fresh fallback chat AI, verifying the provider only until it initializes successfully"""
+    global fallback_ai_config
+    
+    from ..intelligence.chat_ai import ChatAI
+    
+    with _fallback_ai_lock:
+        if fallback_ai_config is None:
+            from ..utils.config_manager import get_config_manager
+            
+            config_manager = get_config_manager()
+            config = {
+                "provider": config_manager.get("ai.provider", "ollama"),
+                "model": config_manager.get("ai.model", "gemma3:4b"),
+                "api_key": config_manager.get("ai.api_key")
+            }
+            
+            if not ChatAI(config).initialize():
+                return None
+            fallback_ai_config = config
+    
+    fallback = ChatAI(fallback_ai_config)
+    fallback.is_initialized = True  # Provider already verified above
+    return fallback
+
+
 @router.post("/command", response_model=ChatCommandResponse)
 async def process_chat_command(request: ChatCommandRequest):
     """
@@ -137,19 +169,9 @@ async def process_chat_command(request: ChatCommandRequest):
     if not chat_orchestrator or not chat_orchestrator.is_initialized:
         # Try to provide a fallback response using basic AI chat
         try:
-            from ..intelligence.chat_ai import ChatAI
-            from ..utils.config_manager import get_config_manager
-            
-            config_manager = get_config_manager()
-            config = {
-                "provider": config_manager.get("ai.provider", "ollama"),
-                "model": config_manager.get("ai.model", "gemma3:4b"),
-                "api_key": config_manager.get("ai.api_key")
-            }
-            
-            fallback_ai = ChatAI(config)
-            if fallback_ai.initialize():
-                ai_response = await fallback_ai.chat(request.message)
+            fallback = _get_fallback_ai()
+            if fallback:
+                ai_response = await fallback.chat(request.message)
                 return ChatCommandResponse(
                     response=f"(Fallback mode) {ai_response.get('response', 'I understand you want help, but the full intelligent chat system is not available right now.')}", 
                     type="fallback",
@@ -543,7 +543,7 @@ class WebController(BaseComponent):
                 cookie['domain'] = domain
             
             self.driver.add_cookie(cookie)
-            self.logger.debug(f"Cookie set: {name}")
+            self.logger.debug("Cookie set: %s", name)
             
         except Exception as e:
             self.logger.error(f"Failed to set cookie: {e}")
@@ -45,7 +45,7 @@ class BaseComponent(ABC):
             'last_operation_time': None
         }
         
-        self.logger.debug(f"Component {self.name} created")
+        self.logger.debug("Component %s created", self.name)
     
     @abstractmethod
     def initialize(self) -> bool:
@@ -123,7 +123,7 @@ class BaseComponent(ABC):
         else:
             self._metrics['error_count'] += 1
         
-        self.logger.debug(f"Metrics updated for {operation}: success={success}")
+        self.logger.debug("Metrics updated for %s: success=%s", operation, success)
     
     def get_success_rate(self) -> float:
         """Get the success rate of operations."""
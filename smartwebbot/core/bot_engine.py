@@ -850,11 +850,11 @@ class SmartWebBot(BaseComponent):
     
     def _on_navigation_completed(self, event_data: Dict):
         """Handle navigation completed event."""
-        self.logger.debug(f"Navigation completed: {event_data['url']}")
+        self.logger.debug("Navigation completed: %s", event_data['url'])
     
     def _on_task_completed(self, event_data: Dict):
         """Handle task completed event."""
-        self.logger.debug(f"Task completed: {event_data.get('description', 'Unknown')}")
+        self.logger.debug("Task completed: %s", event_data.get('description', 'Unknown'))
     
     def _on_error_occurred(self, event_data: Dict):
         """Handle error occurred event."""
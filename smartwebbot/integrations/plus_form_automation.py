@@ -170,7 +170,7 @@ class PlusFormAutomator:
                 if element.is_displayed() and element.is_enabled():
                     return element
             except Exception as e:
-                self.logger.debug(f"Selector failed: {selector} - {e}")
+                self.logger.debug("Selector failed: %s - %s", selector, e)
                 continue
         return None
     
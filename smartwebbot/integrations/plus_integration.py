@@ -646,7 +646,7 @@ class PlusIntegration(BaseComponent):
             except NoSuchElementException:
                 continue
             except Exception as e:
-                self.logger.debug(f"Login button selector {selector} failed: {e}")
+                self.logger.debug("Login button selector %s failed: %s", selector, e)
                 continue
         
         # Try JavaScript click as fallback
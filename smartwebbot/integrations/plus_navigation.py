@@ -62,7 +62,7 @@ class PlusNavigator:
         """Take a screenshot for debugging purposes."""
         try:
             self.web_controller.take_screenshot(filename)
-            self.logger.debug(f"Screenshot saved: {filename}")
+            self.logger.debug("Screenshot saved: %s", filename)
         except Exception as e:
             self.logger.warning(f"Could not take screenshot {filename}: {e}")
     
@@ -87,7 +87,7 @@ class PlusNavigator:
                 self.logger.info(f"SUCCESS: {element_name} clicked using selector: {selector}")
                 return True
             except Exception as e:
-                self.logger.debug(f"{element_name} selector failed: {selector} - {e}")
+                self.logger.debug("%s selector failed: %s - %s", element_name, selector, e)
                 continue
         
         return False
@@ -176,7 +176,7 @@ class PlusNavigator:
                 self._take_screenshot("plus_search_typed.png")
                 return True
             except Exception as e:
-                self.logger.debug(f"Search input selector failed: {selector} - {e}")
+                self.logger.debug("Search input selector failed: %s - %s", selector, e)
                 continue
         
         # Try mobile search input
@@ -193,7 +193,7 @@ class PlusNavigator:
                 self._take_screenshot("plus_search_typed.png")
                 return True
             except Exception as e:
-                self.logger.debug(f"Mobile search input selector failed: {selector} - {e}")
+                self.logger.debug("Mobile search input selector failed: %s - %s", selector, e)
                 continue
         
         # JavaScript fallback for search input
@@ -265,7 +265,7 @@ class PlusNavigator:
             self._take_screenshot("plus_option_selected.png")
             return True
         except Exception as e:
-            self.logger.debug(f"XPath {option_text} click failed: {e}")
+            self.logger.debug("XPath %s click failed: %s", option_text, e)
         
         # JavaScript fallback
         js_code = f"""
@@ -138,7 +138,7 @@ class AIElementDetector(BaseComponent):
                             return best_element
                             
                 except Exception as e:
-                    self.logger.debug(f"Strategy {strategy.__name__} failed: {e}")
+                    self.logger.debug("Strategy %s failed: %s", strategy.__name__, e)
                     continue
             
             # No element found
@@ -454,7 +454,7 @@ class AIElementDetector(BaseComponent):
         # Return the highest scoring element
         best_element, best_score = scored_elements[0]
         
-        self.logger.debug(f"Best element score: {best_score}")
+        self.logger.debug("Best element score: %s", best_score)
         return best_element
     
     def _calculate_element_score(self, element: WebElement, description: str, context: Dict) -> float:
@@ -9,6 +9,7 @@ import asyncio
 import json
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from types import MappingProxyType
 from dataclasses import dataclass
 from enum import Enum
 
@@ -37,6 +38,16 @@ class ActionCategory(Enum):
     WORKFLOW = "workflow"         # Multi-step process management
 
 
+# Numeric score used when ranking actions of each priority
+PRIORITY_SCORES = MappingProxyType({
+    ActionPriority.CRITICAL: 1.0,
+    ActionPriority.HIGH: 0.8,
+    ActionPriority.MEDIUM: 0.6,
+    ActionPriority.LOW: 0.4,
+    ActionPriority.OPTIONAL: 0.2
+})
+
+
 @dataclass
 class ActionPlan:
     """Represents a planned action with context and execution details."""
@@ -102,6 +113,8 @@ class AutonomousActionPlanner(BaseComponent):
         self.confidence_threshold = self.config.get('confidence_threshold', 0.7)
         self.enable_autonomous_execution = self.config.get('enable_autonomous_execution', True)
         self.risk_tolerance = self.config.get('risk_tolerance', 'medium')  # low, medium, high
+        self.step_throttle_seconds = self.config.get('step_throttle_seconds', 0.0)  # pause between actions
+        self.progress_batch_size = max(1, self.config.get('progress_batch_size', 1))  # steps per progress callback
         
     def initialize(self) -> bool:
         """Initialize the autonomous action planner."""
@@ -178,7 +191,7 @@ class AutonomousActionPlanner(BaseComponent):
             self.logger.info(f"Executing action: {action_plan.description}")
             
             # Pre-execution validation
-            if not await self._validate_action_prerequisites(action_plan):
+            if not self._validate_action_prerequisites(action_plan):
                 return {
                     "success": False,
                     "error": "Prerequisites not met",
@@ -193,10 +206,10 @@ class AutonomousActionPlanner(BaseComponent):
             execution_time = (datetime.now() - execution_start).total_seconds()
             
             # Post-execution validation
-            success = await self._validate_action_success(action_plan, result)
+            success = self._validate_action_success(action_plan, result)
             
             # Record results for learning
-            await self._record_action_result(action_plan, result, success, execution_time)
+            self._record_action_result(action_plan, result, success, execution_time)
             
             # Update workflow context
             if success:
@@ -290,10 +303,12 @@ class AutonomousActionPlanner(BaseComponent):
             
             results = []
             failed_actions = []
+            successful_actions = 0
+            execution_time = 0
             
             for i, action_plan in enumerate(workflow):
-                # Progress callback
-                if monitor_callback:
+                # Progress callback (coalesced to every progress_batch_size steps)
+                if monitor_callback and i % self.progress_batch_size == 0:
                     await monitor_callback({
                         "step": i + 1,
                         "total_steps": len(workflow),
@@ -304,8 +319,11 @@ class AutonomousActionPlanner(BaseComponent):
                 # Execute action
                 result = await self.execute_action_plan(action_plan)
                 results.append(result)
+                execution_time += result.get("execution_time", 0)
                 
-                if not result["success"]:
+                if result["success"]:
+                    successful_actions += 1
+                else:
                     failed_actions.append(action_plan.action_id)
                     
                     # Attempt error recovery
@@ -317,11 +335,11 @@ class AutonomousActionPlanner(BaseComponent):
                             self.logger.error(f"Critical action failed, stopping workflow: {action_plan.description}")
                             break
                 
-                # Brief pause between actions
-                await asyncio.sleep(1.0)
+                # Optional pause between actions (e.g. to rate-limit a target site)
+                if self.step_throttle_seconds > 0:
+                    await asyncio.sleep(self.step_throttle_seconds)
             
             # Calculate overall success
-            successful_actions = len([r for r in results if r["success"]])
             success_rate = successful_actions / len(results) if results else 0
             
             workflow_result = {
@@ -330,7 +348,7 @@ class AutonomousActionPlanner(BaseComponent):
                 "successful_actions": successful_actions,
                 "failed_actions": len(failed_actions),
                 "success_rate": success_rate,
-                "execution_time": sum(r.get("execution_time", 0) for r in results),
+                "execution_time": execution_time,
                 "results": results,
                 "failed_action_ids": failed_actions
             }
@@ -452,14 +470,7 @@ class AutonomousActionPlanner(BaseComponent):
     
     def _get_priority_score(self, priority: ActionPriority) -> float:
         """Convert priority to numeric score."""
-        priority_scores = {
-            ActionPriority.CRITICAL: 1.0,
-            ActionPriority.HIGH: 0.8,
-            ActionPriority.MEDIUM: 0.6,
-            ActionPriority.LOW: 0.4,
-            ActionPriority.OPTIONAL: 0.2
-        }
-        return priority_scores.get(priority, 0.5)
+        return PRIORITY_SCORES.get(priority, 0.5)
     
     # Additional helper methods would continue here...
     # (Implementation of other private methods for completeness)
@@ -497,17 +508,17 @@ class AutonomousActionPlanner(BaseComponent):
         # Implementation for loading learning data
         pass
     
-    async def _validate_action_prerequisites(self, action_plan: ActionPlan) -> bool:
+    def _validate_action_prerequisites(self, action_plan: ActionPlan) -> bool:
         """Validate that action prerequisites are met."""
         # Implementation for prerequisite validation
         return True
     
-    async def _validate_action_success(self, action_plan: ActionPlan, result: Dict[str, Any]) -> bool:
+    def _validate_action_success(self, action_plan: ActionPlan, result: Dict[str, Any]) -> bool:
         """Validate that action was successful based on success criteria."""
         # Implementation for success validation
         return result.get("success", False)
     
-    async def _record_action_result(self, action_plan: ActionPlan, result: Dict[str, Any], success: bool, execution_time: float):
+    def _record_action_result(self, action_plan: ActionPlan, result: Dict[str, Any], success: bool, execution_time: float):
         """Record action result for learning."""
         # Implementation for recording results
         pass
@@ -118,7 +118,8 @@ class ChatAI(BaseComponent):
             user_message: User's natural language input
             
         Returns:
-            Dict with 'response', 'actions', and 'confidence'
+            Dict with 'response', 'actions', 'confidence' and the unstripped 'raw_response',
+            or with 'error' instead of 'raw_response' when the provider call failed
         """
         try:
             # Add user message to history
@@ -157,7 +158,8 @@ class ChatAI(BaseComponent):
             return {
                 "response": f"Sorry, I encountered an error: {str(e)}",
                 "actions": [],
-                "confidence": 0.0
+                "confidence": 0.0,
+                "error": str(e)
             }
     
     async def _chat_with_ollama(self, system_prompt: str, user_message: str) -> str:
@@ -274,7 +276,8 @@ Current time: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
             return {
                 "response": clean_response or ai_response,
                 "actions": actions,
-                "confidence": confidence
+                "confidence": confidence,
+                "raw_response": ai_response
             }
             
         except Exception as e:
@@ -282,7 +285,8 @@ Current time: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
             return {
                 "response": ai_response,
                 "actions": [],
-                "confidence": 0.5
+                "confidence": 0.5,
+                "raw_response": ai_response
             }
     
     def get_conversation_history(self) -> List[Dict]:
@@ -191,7 +191,7 @@ class DecisionEngine(BaseComponent):
                 error_indicators=error_indicators
             )
             
-            self.logger.debug(f"Page context analyzed: {page_type}")
+            self.logger.debug("Page context analyzed: %s", page_type)
             return context
             
         except Exception as e:
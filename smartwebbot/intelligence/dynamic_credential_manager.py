@@ -25,6 +25,17 @@ except ImportError:
 from ..core.base_component import BaseComponent
 
 
+# User-facing names for credential fields in prompts
+FRIENDLY_FIELD_NAMES = {
+    "username": "username",
+    "password": "password",
+    "email": "email address",
+    "api_key": "API key",
+    "token": "access token",
+    "code": "verification code"
+}
+
+
 class CredentialType(Enum):
     USERNAME_PASSWORD = "username_password"
     API_KEY = "api_key"
@@ -202,11 +213,10 @@ class DynamicCredentialManager(BaseComponent):
             Result dictionary with credential_id and status
         """
         
-        if request_id not in self.active_requests:
+        request = self.active_requests.get(request_id)
+        if request is None:
             return {"success": False, "error": "Request not found or expired"}
         
-        request = self.active_requests[request_id]
-        
         # Validate required fields
         missing_fields = [field for field in request.required_fields if field not in credentials]
         if missing_fields:
@@ -222,7 +232,7 @@ class DynamicCredentialManager(BaseComponent):
         )
         
         # Clean up the request
-        del self.active_requests[request_id]
+        self.active_requests.pop(request_id, None)
         
         self.logger.info(f"Fulfilled credential request {request_id}, stored as {credential_id}")
         
@@ -364,18 +374,17 @@ class DynamicCredentialManager(BaseComponent):
     async def _remove_credential(self, credential_id: str):
         """Remove a credential entry"""
         
-        if credential_id in self.memory_store:
-            entry = self.memory_store[credential_id]
-            
-            # Remove from session tracking
-            if entry.session_id in self.session_credentials:
-                if credential_id in self.session_credentials[entry.session_id]:
-                    self.session_credentials[entry.session_id].remove(credential_id)
-            
-            # Remove from store
-            del self.memory_store[credential_id]
-            
-            self.logger.info(f"Removed credential {credential_id}")
+        # Remove from store
+        entry = self.memory_store.pop(credential_id, None)
+        if entry is None:
+            return
+        
+        # Remove from session tracking
+        session_credential_ids = self.session_credentials.get(entry.session_id)
+        if session_credential_ids and credential_id in session_credential_ids:
+            session_credential_ids.remove(credential_id)
+        
+        self.logger.info(f"Removed credential {credential_id}")
     
     async def cleanup_expired_credentials(self):
         """Clean up expired credentials"""
@@ -398,31 +407,19 @@ class DynamicCredentialManager(BaseComponent):
     async def cleanup_session_credentials(self, session_id: str):
         """Clean up all credentials for a session"""
         
-        if session_id not in self.session_credentials:
+        credential_ids = self.session_credentials.pop(session_id, None)
+        if credential_ids is None:
             return
         
-        credential_ids = self.session_credentials[session_id].copy()
-        
         for cred_id in credential_ids:
             await self._remove_credential(cred_id)
         
-        del self.session_credentials[session_id]
-        
         self.logger.info(f"Cleaned up {len(credential_ids)} credentials for session {session_id}")
     
     def _generate_credential_prompt(self, platform: str, required_fields: List[str]) -> str:
         """Generate user-friendly credential prompt"""
         
-        field_names = {
-            "username": "username",
-            "password": "password",
-            "email": "email address",
-            "api_key": "API key",
-            "token": "access token",
-            "code": "verification code"
-        }
-        
-        friendly_fields = [field_names.get(field, field) for field in required_fields]
+        friendly_fields = [FRIENDLY_FIELD_NAMES.get(field, field) for field in required_fields]
         
         if len(friendly_fields) == 1:
             return f"Please provide your {friendly_fields[0]} for {platform}."
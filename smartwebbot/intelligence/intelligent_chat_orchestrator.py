@@ -11,9 +11,13 @@ This is the master brain that:
 
 import json
 import re
+import string
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
+import functools
+import time
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,6 +28,156 @@ from .smart_next_step_predictor import SmartNextStepPredictor
 from ..automation.web_controller import WebController
 
 
+def _compile_pattern_groups(pattern_groups) -> Tuple[Tuple[str, Tuple[str, ...], Optional["re.Pattern"]], ...]:
+    """
+    Precompile named pattern groups for _match_pattern_groups.
+    
+    Patterns without regex metacharacters are kept as plain substrings so
+    they can be tested with ``in``; the rest of each group is compiled into a
+    single alternation.
+    """
+    compiled = []
+    for name, patterns in pattern_groups:
+        literals = tuple(p for p in patterns if re.escape(p) == p)
+        regexes = [p for p in patterns if p not in literals]
+        compiled.append((name, literals, re.compile("|".join(regexes)) if regexes else None))
+    return tuple(compiled)
+
+
+def _match_pattern_groups(pattern_groups, text: str) -> Optional[str]:
+    """Return the name of the first group (in declaration order) matching text"""
+    for name, literals, pattern in pattern_groups:
+        if any(literal in text for literal in literals) or (pattern and pattern.search(text)):
+            return name
+    return None
+
+
+# Command parsing patterns, compiled once at import
+INTENT_PATTERNS = _compile_pattern_groups((
+    ("marketing_campaign", (
+        r"market(?:ing)?.*product",
+        r"promote.*business",
+        r"advertise.*",
+        r"social media.*campaign"
+    )),
+    ("login_to_platform", (
+        r"log(?:in|on).*to",
+        r"sign.*in.*to",
+        r"access.*account"
+    ))
+))
+
+ACTION_TYPE_PATTERNS = _compile_pattern_groups((
+    ("post", (r"post", r"share", r"publish")),
+    ("login", (r"log(?:in|on)", r"sign.*in", r"access")),
+    ("search", (r"search", r"find", r"look.*for")),
+    ("navigate", (r"go.*to", r"visit", r"open")),
+    ("fill_form", (r"fill.*form", r"enter.*data", r"submit")),
+    ("marketing", (r"market", r"promote", r"advertise", r"campaign"))
+))
+
+PLATFORM_KEYWORDS = {
+    "instagram": ("instagram", "insta", "ig"),
+    "facebook": ("facebook", "fb"),
+    "twitter": ("twitter", "x.com"),
+    "linkedin": ("linkedin",),
+    "youtube": ("youtube", "yt"),
+    "tiktok": ("tiktok", "tik tok"),
+    "plus": ("plus", "plus.reconext.com")
+}
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Single-word keywords are matched against the command's word set (so "sign in" isn't
+# read as instagram via "ig", nor "surplus" as plus); keywords with punctuation or
+# spaces are matched as substrings
+PLATFORM_KEYWORD_GROUPS = tuple(
+    (
+        platform,
+        frozenset(keyword for keyword in keywords if WORD_PATTERN.fullmatch(keyword)),
+        tuple(keyword for keyword in keywords if not WORD_PATTERN.fullmatch(keyword))
+    )
+    for platform, keywords in PLATFORM_KEYWORDS.items()
+)
+
+# Prompt for LLM parsing of commands the patterns don't fully recognize
+COMMAND_PARSE_PROMPT = """
+Parse this command and extract:
+1. Intent (what the user wants to achieve)
+2. Target platform (Instagram, Facebook, etc.)
+3. Action type (login, post, search, etc.)
+4. Required credentials
+5. Estimated complexity
+6. Any other details the command specifies, as a "parameters" object
+
+Command: "{command}"
+
+Respond in JSON format.
+"""
+
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Built-in platform URLs
+KNOWN_PLATFORM_URLS = MappingProxyType({
+    "instagram": "https://www.instagram.com",
+    "facebook": "https://www.facebook.com",
+    "twitter": "https://twitter.com",
+    "linkedin": "https://www.linkedin.com",
+    "youtube": "https://www.youtube.com",
+    "tiktok": "https://www.tiktok.com",
+    "plus": "https://plus.reconext.com"
+})
+
+# Knowledge about different platforms
+PLATFORM_KNOWLEDGE = MappingProxyType({
+    "instagram": {
+        "login_flow": ("navigate", "fill_username", "fill_password", "click_login"),
+        "post_flow": ("click_new_post", "upload_image", "add_caption", "click_share"),
+        "selectors": {
+            "username": "input[name='username']",
+            "password": "input[name='password']",
+            "login_button": "button[type='submit']"
+        }
+    },
+    "plus": {
+        "login_flow": ("navigate", "fill_username", "fill_password", "click_login"),
+        "selectors": {
+            "username": "input[name='username']",
+            "password": "input[name='password']",
+            "login_button": "button[type='submit']"
+        }
+    }
+})
+
+# Patterns for command recognition
+COMMAND_PATTERNS = MappingProxyType({
+    "marketing_commands": (
+        "market my product on {platform}",
+        "promote my business on {platform}",
+        "create a marketing campaign for {platform}",
+        "advertise on {platform}"
+    ),
+    "automation_commands": (
+        "automate {action} on {platform}",
+        "help me {action} on {platform}",
+        "do {action} automatically"
+    )
+})
+
+# Complexity indicators: single words are matched as tokens, phrases as substrings
+COMPLEX_INDICATOR_WORDS = frozenset({
+    "marketing", "campaign", "strategy", "multiple", "workflow"
+})
+
+COMPLEX_INDICATOR_PHRASES = (
+    "automate everything", "full process", "end to end"
+)
+
+SIMPLE_INDICATOR_WORDS = frozenset({
+    "click", "fill", "login", "navigate", "open", "close"
+})
+
+
 class CommandComplexity(Enum):
     SIMPLE = "simple"          # Single action: "click login button"
     MODERATE = "moderate"      # Few steps: "login to website"  
@@ -38,15 +192,32 @@ class CredentialType(Enum):
     TWO_FACTOR = "two_factor"
 
 
-@dataclass
+# Rough number of workflow steps for each command complexity
+ESTIMATED_STEPS = MappingProxyType({
+    CommandComplexity.SIMPLE: 1,
+    CommandComplexity.MODERATE: 3,
+    CommandComplexity.COMPLEX: 8,
+    CommandComplexity.ADVANCED: 15
+})
+
+# Action types that require logging in to the target platform
+CREDENTIALED_ACTION_TYPES = frozenset({"login", "post", "marketing"})
+
+
+@dataclass(frozen=True)
 class UserCommand:
-    """Represents a parsed user command"""
+    """Represents a parsed user command (immutable once parsed)"""
+    __slots__ = (
+        "original_text", "intent", "target_platform", "action_type", "complexity",
+        "required_credentials", "estimated_steps", "confidence", "parsed_parameters"
+    )
+    
     original_text: str
     intent: str
     target_platform: Optional[str]
     action_type: str
     complexity: CommandComplexity
-    required_credentials: List[CredentialType]
+    required_credentials: Tuple[CredentialType, ...]
     estimated_steps: int
     confidence: float
     parsed_parameters: Dict[str, Any]
@@ -55,13 +226,65 @@ class UserCommand:
 @dataclass
 class ExecutionContext:
     """Context for command execution"""
+    __slots__ = (
+        "user_command", "session_id", "current_url", "credentials", "workflow_state",
+        "pending_user_inputs", "execution_history", "pending_plan"
+    )
+    
     user_command: UserCommand
     session_id: str
     current_url: Optional[str]
     credentials: Dict[str, Any]
     workflow_state: Dict[str, Any]
     pending_user_inputs: List[str]
-    execution_history: List[Dict[str, Any]]
+    execution_history: Deque[Dict[str, Any]]
+    pending_plan: Optional[List[Dict[str, Any]]]  # plan awaiting credentials
+
+
+# (goal keyword, display name, URL) for platforms with a built-in navigate/login workflow
+SIMPLE_WORKFLOW_PLATFORMS = (
+    ("instagram", "Instagram", "https://instagram.com"),
+    ("facebook", "Facebook", "https://facebook.com"),
+)
+
+
+@dataclass
+class SimpleActionPlan:
+    """A workflow step produced by SimpleActionPlanner"""
+    action_type: str
+    description: str
+    parameters: Dict[str, Any]
+
+
+class SimpleActionPlanner:
+    """Action planner that works without complex dependencies"""
+    
+    def __init__(self):
+        self.is_initialized = False
+    
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+    
+    async def create_autonomous_workflow(self, goal: str, constraints: Dict = None) -> List:
+        """Create a simple workflow based on the goal"""
+        # Simple workflow generation based on common patterns
+        goal_lower = goal.lower()
+        execute_step = SimpleActionPlan("execute", f"Execute: {goal}", {"goal": goal})
+        
+        for keyword, name, url in SIMPLE_WORKFLOW_PLATFORMS:
+            if keyword in goal_lower:
+                return [
+                    SimpleActionPlan("navigate", f"Navigate to {name}", {"url": url}),
+                    SimpleActionPlan("login", f"Login to {name}", {"credentials_required": True}),
+                    execute_step
+                ]
+        
+        # Generic workflow
+        return [
+            SimpleActionPlan("analyze", f"Analyze request: {goal}", {"goal": goal}),
+            execute_step
+        ]
 
 
 class IntelligentChatOrchestrator(BaseComponent):
@@ -86,13 +309,29 @@ class IntelligentChatOrchestrator(BaseComponent):
         self.web_controller = None
         
         # Execution state
-        self.active_sessions: Dict[str, ExecutionContext] = {}
-        self.platform_knowledge = self._load_platform_knowledge()
-        self.command_patterns = self._load_command_patterns()
+        self.active_sessions: "OrderedDict[str, ExecutionContext]" = OrderedDict()  # LRU order
+        self.platform_knowledge = PLATFORM_KNOWLEDGE
+        self.command_patterns = COMMAND_PATTERNS
         
         # Configuration
         self.max_workflow_steps = config.get("max_workflow_steps", 50) if config else 50
         self.auto_search_enabled = config.get("auto_search_enabled", True) if config else True
+        self.parse_cache_size = config.get("parse_cache_size", 1024) if config else 1024
+        self.max_sessions = max(1, config.get("max_sessions", 1000) if config else 1000)
+        self.max_execution_history = config.get("max_execution_history", 200) if config else 200
+        
+        # Step handlers by action type
+        self._step_handlers = {
+            "navigate": self._execute_navigate_step,
+            "fill_form": self._execute_fill_form_step,
+            "click": self._execute_click_step,
+            "wait_for_input": self._execute_wait_for_input_step
+        }
+        
+        # Pattern extraction is pure, so cache it per input text
+        self._parse_patterns_cached = functools.lru_cache(maxsize=self.parse_cache_size)(
+            self._parse_command_patterns
+        )
         
     def initialize(self) -> bool:
         """Initialize all AI components"""
@@ -164,38 +403,8 @@ class IntelligentChatOrchestrator(BaseComponent):
             # Create or update execution context
             context = self._get_or_create_context(session_id, parsed_command, current_context)
             
-            # Check if we need credentials
-            if parsed_command.required_credentials and not self._has_required_credentials(context):
-                return await self._request_credentials(context)
-            
-            # Check if we need to find URLs
-            if parsed_command.target_platform and not self._has_target_url(context):
-                url_result = await self._find_platform_url(parsed_command.target_platform)
-                if url_result:
-                    context.current_url = url_result["url"]
-                else:
-                    return {
-                        "response": f"I couldn't find the URL for {parsed_command.target_platform}. Could you provide the URL?",
-                        "type": "url_request",
-                        "session_id": session_id
-                    }
+            return await self._continue_command(context)
             
-            # Generate execution plan
-            execution_plan = await self._create_execution_plan(context)
-            
-            # Execute if simple, or return plan for complex commands
-            if parsed_command.complexity in [CommandComplexity.SIMPLE, CommandComplexity.MODERATE]:
-                return await self._execute_workflow(context, execution_plan)
-            else:
-                return {
-                    "response": f"I've created a plan to {parsed_command.intent}. Here's what I'll do:",
-                    "execution_plan": execution_plan,
-                    "estimated_steps": parsed_command.estimated_steps,
-                    "type": "execution_plan",
-                    "session_id": session_id,
-                    "actions": ["confirm_execution"]
-                }
-                
         except Exception as e:
             self.logger.error(f"Command processing error: {e}")
             return {
@@ -204,29 +413,73 @@ class IntelligentChatOrchestrator(BaseComponent):
                 "session_id": session_id
             }
     
-    async def _parse_user_command(self, user_input: str) -> UserCommand:
-        """Parse natural language into structured command"""
+    async def _continue_command(self, context: ExecutionContext) -> Dict[str, Any]:
+        """
+        Drive the session's parsed command through credentials, URL lookup,
+        planning and execution.
         
-        # Use ChatAI to understand the command
-        chat_response = await self.chat_ai.chat(f"""
-        Parse this command and extract:
-        1. Intent (what the user wants to achieve)
-        2. Target platform (Instagram, Facebook, etc.)
-        3. Action type (login, post, search, etc.)
-        4. Required credentials
-        5. Estimated complexity
+        Resumable: when it stops to ask for credentials, the execution plan is
+        kept on the context so provide_credentials can pick up from here
+        without re-parsing or re-planning the command.
+        """
+        command = context.user_command
+        
+        # Check if we need credentials
+        missing_credentials = self._find_missing_credentials(context)
+        if missing_credentials:
+            if context.pending_plan is None:
+                context.pending_plan = await self._create_execution_plan(context)
+            return self._request_credentials(context, missing_credentials)
+        
+        # Check if we need to find URLs
+        if command.target_platform and not self._has_target_url(context):
+            url_result = await self._find_platform_url(command.target_platform)
+            if url_result:
+                context.current_url = url_result["url"]
+            else:
+                return {
+                    "response": f"I couldn't find the URL for {command.target_platform}. Could you provide the URL?",
+                    "type": "url_request",
+                    "session_id": context.session_id
+                }
         
-        Command: "{user_input}"
+        # Generate execution plan (or reuse the one made before asking for credentials)
+        execution_plan = context.pending_plan
+        if execution_plan is None:
+            execution_plan = await self._create_execution_plan(context)
+        context.pending_plan = None
         
-        Respond in JSON format.
-        """)
+        # Execute if simple, or return plan for complex commands
+        if command.complexity in [CommandComplexity.SIMPLE, CommandComplexity.MODERATE]:
+            return await self._execute_workflow(context, execution_plan)
+        else:
+            return {
+                "response": f"I've created a plan to {command.intent}. Here's what I'll do:",
+                "execution_plan": execution_plan,
+                "estimated_steps": command.estimated_steps,
+                "type": "execution_plan",
+                "session_id": context.session_id,
+                "actions": ["confirm_execution"]
+            }
+    
+    async def _parse_user_command(self, user_input: str) -> UserCommand:
+        """Parse natural language into structured command"""
         
         # Enhanced parsing with pattern matching
-        intent = self._extract_intent(user_input)
-        target_platform = self._extract_platform(user_input)
-        action_type = self._extract_action_type(user_input)
-        complexity = self._assess_complexity(user_input, intent)
-        required_credentials = self._determine_required_credentials(target_platform, action_type)
+        intent, target_platform, action_type, complexity, required_credentials = \
+            self._parse_patterns_cached(user_input)
+        
+        parsed_parameters = {}
+        
+        # Pattern matching fully recognized the command, no need for the LLM roundtrip
+        if intent != "general_automation" and target_platform and action_type != "general":
+            confidence = 0.95
+        else:
+            # Use ChatAI to understand the command
+            chat_response = await self.chat_ai.chat(COMMAND_PARSE_PROMPT.format(command=user_input))
+            # "response" has its JSON stripped for display, so read the model's own text
+            parsed_parameters = self._extract_llm_parameters(chat_response.get("raw_response", ""))
+            confidence = 0.85  # Will be improved with ML
         
         return UserCommand(
             original_text=user_input,
@@ -236,10 +489,40 @@ class IntelligentChatOrchestrator(BaseComponent):
             complexity=complexity,
             required_credentials=required_credentials,
             estimated_steps=self._estimate_steps(complexity),
-            confidence=0.85,  # Will be improved with ML
-            parsed_parameters={}
+            confidence=confidence,
+            parsed_parameters=parsed_parameters
         )
     
+    def _extract_llm_parameters(self, response_text: str) -> Dict[str, Any]:
+        """Extract the "parameters" object from the LLM's JSON parse of a command"""
+        
+        json_match = JSON_OBJECT_PATTERN.search(response_text)
+        if not json_match:
+            return {}
+        
+        try:
+            parameters = json.loads(json_match.group()).get("parameters", {})
+        except (ValueError, AttributeError):
+            return {}
+        
+        return parameters if isinstance(parameters, dict) else {}
+    
+    def _parse_command_patterns(
+        self, user_input: str
+    ) -> Tuple[str, Optional[str], str, CommandComplexity, Tuple[CredentialType, ...]]:
+        """Run the pattern-based extractors over the command text"""
+        
+        # Lowercase once and share it across the extractors
+        user_lower = user_input.lower()
+        
+        intent = self._extract_intent(user_lower)
+        target_platform = self._extract_platform(user_lower)
+        action_type = self._extract_action_type(user_lower)
+        complexity = self._assess_complexity(user_lower, intent)
+        required_credentials = self._determine_required_credentials(target_platform, action_type)
+        
+        return intent, target_platform, action_type, complexity, tuple(required_credentials)
+    
     async def _create_execution_plan(self, context: ExecutionContext) -> List[Dict[str, Any]]:
         """Create detailed execution plan for the command"""
         
@@ -260,7 +543,7 @@ class IntelligentChatOrchestrator(BaseComponent):
         
         # Use the existing create_autonomous_workflow method if available
         if hasattr(self.action_planner, 'create_autonomous_workflow'):
-            goal = context.user_command.intent if hasattr(context, 'user_command') and context.user_command else "unknown task"
+            goal = context.user_command.intent if context.user_command else "unknown task"
             workflow = await self.action_planner.create_autonomous_workflow(
                 goal=goal,
                 constraints=plan_request.get("constraints")
@@ -269,7 +552,7 @@ class IntelligentChatOrchestrator(BaseComponent):
                     "parameters": action.parameters} for action in workflow]
         else:
             # Fallback to simple workflow creation
-            return await self._create_simple_workflow(context)
+            return self._create_simple_workflow(context)
     
     async def _execute_workflow(self, context: ExecutionContext, execution_plan: List[Dict]) -> Dict[str, Any]:
         """Execute the workflow steps"""
@@ -277,19 +560,9 @@ class IntelligentChatOrchestrator(BaseComponent):
         results = []
         current_step = 0
         
+        # Steps run strictly in order: browser steps share one Selenium driver
         for step in execution_plan:
             try:
-                # Predict next step for better execution (if predictor is available)
-                next_prediction = None
-                if self.next_step_predictor and hasattr(self.next_step_predictor, 'predict_next_steps'):
-                    try:
-                        # Note: predict_next_steps expects PageState and UserGoal objects, not dicts
-                        # For now, we'll skip this prediction and handle it later
-                        pass
-                    except Exception as e:
-                        self.logger.warning(f"Next step prediction failed: {e}")
-                        next_prediction = None
-                
                 # Execute the step (this would integrate with existing automation)
                 step_result = await self._execute_single_step(step, context)
                 results.append(step_result)
@@ -299,7 +572,7 @@ class IntelligentChatOrchestrator(BaseComponent):
                     "step": current_step,
                     "action": step,
                     "result": step_result,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": time.time()  # epoch seconds
                 })
                 
                 current_step += 1
@@ -323,124 +596,80 @@ class IntelligentChatOrchestrator(BaseComponent):
         """Execute a single workflow step"""
         
         action_type = step.get("action", "unknown")
-        
-        if action_type == "navigate":
-            # Use web controller to navigate
-            if self.web_controller:
-                await self.web_controller.navigate_to(step["url"])
-                return {"status": "success", "action": "navigate", "url": step["url"]}
-        
-        elif action_type == "fill_form":
-            # Use form handler to fill forms
-            return {"status": "success", "action": "fill_form", "fields": step.get("fields", [])}
-        
-        elif action_type == "click":
-            # Use element detector and click
-            return {"status": "success", "action": "click", "element": step.get("selector")}
-        
-        elif action_type == "wait_for_input":
-            # Request user input
-            return {
-                "status": "waiting", 
-                "action": "user_input_required",
-                "message": step.get("message", "Please provide input")
-            }
-        
-        else:
-            return {"status": "unknown", "action": action_type}
+        handler = self._step_handlers.get(action_type, self._execute_unknown_step)
+        return await handler(step, context)
     
-    def _extract_intent(self, user_input: str) -> str:
-        """Extract the main intent from user input"""
+    async def _execute_navigate_step(self, step: Dict, context: ExecutionContext) -> Dict[str, Any]:
+        """Navigate to the step URL"""
         
-        # Pattern matching for common intents
-        marketing_patterns = [
-            r"market(?:ing)?.*product",
-            r"promote.*business",
-            r"advertise.*",
-            r"social media.*campaign"
-        ]
+        if not self.web_controller:
+            return {"status": "error", "action": "navigate", "error": "Web controller not available"}
         
-        login_patterns = [
-            r"log(?:in|on).*to",
-            r"sign.*in.*to",
-            r"access.*account"
-        ]
-        
-        for pattern in marketing_patterns:
-            if re.search(pattern, user_input.lower()):
-                return "marketing_campaign"
+        # Use web controller to navigate (blocking Selenium call, run off the event loop)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.web_controller.navigate_to, step["url"])
+        return {"status": "success", "action": "navigate", "url": step["url"]}
+    
+    async def _execute_fill_form_step(self, step: Dict, context: ExecutionContext) -> Dict[str, Any]:
+        """Fill the step form fields"""
         
-        for pattern in login_patterns:
-            if re.search(pattern, user_input.lower()):
-                return "login_to_platform"
+        # Use form handler to fill forms
+        return {"status": "success", "action": "fill_form", "fields": step.get("fields", [])}
+    
+    async def _execute_click_step(self, step: Dict, context: ExecutionContext) -> Dict[str, Any]:
+        """Click the step element"""
         
-        # Default intent extraction
-        return "general_automation"
+        # Use element detector and click
+        return {"status": "success", "action": "click", "element": step.get("selector")}
     
-    def _extract_platform(self, user_input: str) -> Optional[str]:
-        """Extract target platform from user input"""
+    async def _execute_wait_for_input_step(self, step: Dict, context: ExecutionContext) -> Dict[str, Any]:
+        """Request user input"""
         
-        platforms = {
-            "instagram": ["instagram", "insta", "ig"],
-            "facebook": ["facebook", "fb"],
-            "twitter": ["twitter", "x.com"],
-            "linkedin": ["linkedin"],
-            "youtube": ["youtube", "yt"],
-            "tiktok": ["tiktok", "tik tok"],
-            "plus": ["plus", "plus.reconext.com"]
+        return {
+            "status": "waiting", 
+            "action": "user_input_required",
+            "message": step.get("message", "Please provide input")
         }
+    
+    async def _execute_unknown_step(self, step: Dict, context: ExecutionContext) -> Dict[str, Any]:
+        """Report a step whose action has no handler"""
         
-        user_lower = user_input.lower()
-        
-        for platform, keywords in platforms.items():
-            for keyword in keywords:
-                if keyword in user_lower:
-                    return platform
-        
-        return None
+        return {"status": "unknown", "action": step.get("action", "unknown")}
     
-    def _extract_action_type(self, user_input: str) -> str:
-        """Extract the type of action requested"""
+    def _extract_intent(self, user_lower: str) -> str:
+        """Extract the main intent from lowercased user input"""
         
-        action_patterns = {
-            "post": [r"post", r"share", r"publish"],
-            "login": [r"log(?:in|on)", r"sign.*in", r"access"],
-            "search": [r"search", r"find", r"look.*for"],
-            "navigate": [r"go.*to", r"visit", r"open"],
-            "fill_form": [r"fill.*form", r"enter.*data", r"submit"],
-            "marketing": [r"market", r"promote", r"advertise", r"campaign"]
-        }
+        # Pattern matching for common intents, with a default intent otherwise
+        return _match_pattern_groups(INTENT_PATTERNS, user_lower) or "general_automation"
+    
+    def _extract_platform(self, user_lower: str) -> Optional[str]:
+        """Extract target platform from lowercased user input"""
         
-        user_lower = user_input.lower()
+        words = set(WORD_PATTERN.findall(user_lower))
         
-        for action, patterns in action_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, user_lower):
-                    return action
+        for platform, keywords, phrases in PLATFORM_KEYWORD_GROUPS:
+            if not keywords.isdisjoint(words) or any(phrase in user_lower for phrase in phrases):
+                return platform
         
-        return "general"
+        return None
     
-    def _assess_complexity(self, user_input: str, intent: str) -> CommandComplexity:
-        """Assess the complexity of the command"""
-        
-        # Complex indicators
-        complex_indicators = [
-            "marketing", "campaign", "strategy", "multiple", "workflow",
-            "automate everything", "full process", "end to end"
-        ]
+    def _extract_action_type(self, user_lower: str) -> str:
+        """Extract the type of action requested from lowercased user input"""
         
-        # Simple indicators  
-        simple_indicators = [
-            "click", "fill", "login", "navigate", "open", "close"
-        ]
+        return _match_pattern_groups(ACTION_TYPE_PATTERNS, user_lower) or "general"
+    
+    def _assess_complexity(self, user_lower: str, intent: str) -> CommandComplexity:
+        """Assess the complexity of the lowercased command"""
         
-        user_lower = user_input.lower()
+        words = user_lower.split()
+        tokens = {word.strip(string.punctuation) for word in words}
         
-        if any(indicator in user_lower for indicator in complex_indicators):
+        if not COMPLEX_INDICATOR_WORDS.isdisjoint(tokens) or \
+                any(phrase in user_lower for phrase in COMPLEX_INDICATOR_PHRASES):
             return CommandComplexity.ADVANCED
-        elif any(indicator in user_lower for indicator in simple_indicators):
+        elif not SIMPLE_INDICATOR_WORDS.isdisjoint(tokens):
             return CommandComplexity.SIMPLE
-        elif len(user_input.split()) > 10:
+        elif len(words) > 10:
             return CommandComplexity.COMPLEX
         else:
             return CommandComplexity.MODERATE
@@ -452,63 +681,65 @@ class IntelligentChatOrchestrator(BaseComponent):
             return []
         
         # Most platforms need username/password for login
-        if action_type in ["login", "post", "marketing"]:
+        if action_type in CREDENTIALED_ACTION_TYPES:
             return [CredentialType.USERNAME_PASSWORD]
         
         return []
     
     def _estimate_steps(self, complexity: CommandComplexity) -> int:
         """Estimate number of steps based on complexity"""
-        
-        step_mapping = {
-            CommandComplexity.SIMPLE: 1,
-            CommandComplexity.MODERATE: 3,
-            CommandComplexity.COMPLEX: 8,
-            CommandComplexity.ADVANCED: 15
-        }
-        
-        return step_mapping.get(complexity, 5)
+        return ESTIMATED_STEPS.get(complexity, 5)
     
     def _get_or_create_context(self, session_id: str, command: UserCommand, current_context: Dict = None) -> ExecutionContext:
         """Get existing context or create new one"""
         
-        if session_id not in self.active_sessions:
-            self.active_sessions[session_id] = ExecutionContext(
-                user_command=command,
-                session_id=session_id,
-                current_url=current_context.get("url") if current_context else None,
-                credentials={},
-                workflow_state={},
-                pending_user_inputs=[],
-                execution_history=[]
-            )
+        context = self.active_sessions.get(session_id)
+        if context is not None:
+            self.active_sessions.move_to_end(session_id)
+            
+            # A new command replaces the session's previous one and its pending plan
+            if context.user_command != command:
+                context.user_command = command
+                context.pending_plan = None
+            return context
+        
+        # Evict the least recently used sessions to keep memory bounded
+        while len(self.active_sessions) >= self.max_sessions:
+            self.active_sessions.popitem(last=False)
+        
+        context = ExecutionContext(
+            user_command=command,
+            session_id=session_id,
+            current_url=current_context.get("url") if current_context else None,
+            credentials={},
+            workflow_state={},
+            pending_user_inputs=[],
+            execution_history=deque(maxlen=self.max_execution_history),
+            pending_plan=None
+        )
+        self.active_sessions[session_id] = context
         
-        return self.active_sessions[session_id]
+        return context
     
-    def _has_required_credentials(self, context: ExecutionContext) -> bool:
-        """Check if we have all required credentials"""
+    def _find_missing_credentials(self, context: ExecutionContext) -> List[str]:
+        """Return the required credential fields we don't have yet (empty if none)"""
         
+        missing_creds = []
         for cred_type in context.user_command.required_credentials:
             if cred_type == CredentialType.USERNAME_PASSWORD:
-                if not (context.credentials.get("username") and context.credentials.get("password")):
-                    return False
+                if not context.credentials.get("username"):
+                    missing_creds.append("username")
+                if not context.credentials.get("password"):
+                    missing_creds.append("password")
         
-        return True
+        return missing_creds
     
     def _has_target_url(self, context: ExecutionContext) -> bool:
         """Check if we have the target URL"""
         return bool(context.current_url)
     
-    async def _request_credentials(self, context: ExecutionContext) -> Dict[str, Any]:
-        """Request credentials from user"""
-        
-        missing_creds = []
-        for cred_type in context.user_command.required_credentials:
-            if cred_type == CredentialType.USERNAME_PASSWORD:
-                if not context.credentials.get("username"):
-                    missing_creds.append("username")
-                if not context.credentials.get("password"):
-                    missing_creds.append("password")
+    def _request_credentials(self, context: ExecutionContext, missing_creds: List[str]) -> Dict[str, Any]:
+        """Request the missing credentials from user"""
         
         return {
             "response": f"I need your {' and '.join(missing_creds)} for {context.user_command.target_platform} to proceed.",
@@ -520,107 +751,22 @@ class IntelligentChatOrchestrator(BaseComponent):
     async def _find_platform_url(self, platform: str) -> Optional[Dict[str, Any]]:
         """Find URL for a platform using web search"""
         
-        # Built-in platform URLs
-        known_urls = {
-            "instagram": "https://www.instagram.com",
-            "facebook": "https://www.facebook.com",
-            "twitter": "https://twitter.com",
-            "linkedin": "https://www.linkedin.com",
-            "youtube": "https://www.youtube.com",
-            "tiktok": "https://www.tiktok.com",
-            "plus": "https://plus.reconext.com"
-        }
-        
-        if platform.lower() in known_urls:
-            return {"url": known_urls[platform.lower()], "source": "built_in"}
+        url = KNOWN_PLATFORM_URLS.get(platform.lower())
+        if url:
+            return {"url": url, "source": "built_in"}
         
         # TODO: Implement web search for unknown platforms
         # This would use a search API to find the platform URL
         
         return None
     
-    def _load_platform_knowledge(self) -> Dict[str, Any]:
-        """Load knowledge about different platforms"""
-        
-        return {
-            "instagram": {
-                "login_flow": ["navigate", "fill_username", "fill_password", "click_login"],
-                "post_flow": ["click_new_post", "upload_image", "add_caption", "click_share"],
-                "selectors": {
-                    "username": "input[name='username']",
-                    "password": "input[name='password']",
-                    "login_button": "button[type='submit']"
-                }
-            },
-            "plus": {
-                "login_flow": ["navigate", "fill_username", "fill_password", "click_login"],
-                "selectors": {
-                    "username": "input[name='username']", 
-                    "password": "input[name='password']",
-                    "login_button": "button[type='submit']"
-                }
-            }
-        }
-    
     def _create_simple_action_planner(self):
         """Create a simple action planner that works without complex dependencies"""
-        
-        class SimpleActionPlanner:
-            def __init__(self):
-                self.is_initialized = False
-            
-            def initialize(self) -> bool:
-                self.is_initialized = True
-                return True
-            
-            async def create_autonomous_workflow(self, goal: str, constraints: Dict = None) -> List:
-                """Create a simple workflow based on the goal"""
-                # Simple workflow generation based on common patterns
-                workflow_steps = []
-                
-                if "instagram" in goal.lower():
-                    workflow_steps = [
-                        {"action_type": "navigate", "description": "Navigate to Instagram", 
-                         "parameters": {"url": "https://instagram.com"}},
-                        {"action_type": "login", "description": "Login to Instagram",
-                         "parameters": {"credentials_required": True}},
-                        {"action_type": "execute", "description": f"Execute: {goal}",
-                         "parameters": {"goal": goal}}
-                    ]
-                elif "facebook" in goal.lower():
-                    workflow_steps = [
-                        {"action_type": "navigate", "description": "Navigate to Facebook",
-                         "parameters": {"url": "https://facebook.com"}},
-                        {"action_type": "login", "description": "Login to Facebook",
-                         "parameters": {"credentials_required": True}},
-                        {"action_type": "execute", "description": f"Execute: {goal}",
-                         "parameters": {"goal": goal}}
-                    ]
-                else:
-                    # Generic workflow
-                    workflow_steps = [
-                        {"action_type": "analyze", "description": f"Analyze request: {goal}",
-                         "parameters": {"goal": goal}},
-                        {"action_type": "execute", "description": f"Execute: {goal}",
-                         "parameters": {"goal": goal}}
-                    ]
-                
-                # Convert to action plan objects
-                from dataclasses import dataclass
-                
-                @dataclass
-                class SimpleActionPlan:
-                    action_type: str
-                    description: str
-                    parameters: Dict[str, Any]
-                
-                return [SimpleActionPlan(**step) for step in workflow_steps]
-        
         return SimpleActionPlanner()
     
-    async def _create_simple_workflow(self, context) -> List[Dict[str, Any]]:
+    def _create_simple_workflow(self, context) -> List[Dict[str, Any]]:
         """Create a simple workflow when action planner is not available"""
-        goal = context.user_command.intent if hasattr(context, 'user_command') and context.user_command else "unknown"
+        goal = context.user_command.intent if context.user_command else "unknown"
         
         return [
             {"type": "analyze", "description": f"Analyze request: {goal}", 
@@ -629,38 +775,26 @@ class IntelligentChatOrchestrator(BaseComponent):
              "parameters": {"goal": goal}}
         ]
 
-    def _load_command_patterns(self) -> Dict[str, Any]:
-        """Load patterns for command recognition"""
-        
-        return {
-            "marketing_commands": [
-                "market my product on {platform}",
-                "promote my business on {platform}",
-                "create a marketing campaign for {platform}",
-                "advertise on {platform}"
-            ],
-            "automation_commands": [
-                "automate {action} on {platform}",
-                "help me {action} on {platform}",
-                "do {action} automatically"
-            ]
-        }
-    
     async def provide_credentials(self, session_id: str, credentials: Dict[str, str]) -> Dict[str, Any]:
         """Provide credentials for a session"""
         
-        if session_id in self.active_sessions:
-            context = self.active_sessions[session_id]
-            context.credentials.update(credentials)
-            
-            # Continue execution now that we have credentials
-            return await self.process_command(
-                context.user_command.original_text, 
-                session_id,
-                {"url": context.current_url}
-            )
+        context = self.active_sessions.get(session_id)
+        if context is None:
+            return {"response": "Session not found", "type": "error"}
         
-        return {"response": "Session not found", "type": "error"}
+        context.credentials.update(credentials)
+        
+        # Continue execution now that we have credentials
+        try:
+            return await self._continue_command(context)
+            
+        except Exception as e:
+            self.logger.error(f"Command processing error: {e}")
+            return {
+                "response": f"I encountered an error processing your command: {str(e)}",
+                "type": "error",
+                "session_id": session_id
+            }
     
     def cleanup(self) -> bool:
         """Clean up resources"""
@@ -674,6 +808,7 @@ class IntelligentChatOrchestrator(BaseComponent):
                 self.next_step_predictor.cleanup()
             
             self.active_sessions.clear()
+            self._parse_patterns_cached.cache_clear()
             return True
             
         except Exception as e:
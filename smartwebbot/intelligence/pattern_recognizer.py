@@ -8,6 +8,13 @@ from typing import Dict, List, Optional, Any
 from ..core.base_component import BaseComponent
 
 
+# (keyword, pattern type, confidence) checked against the lowercased page source
+PAGE_KEYWORD_PATTERNS = (
+    ("login", "login_form", 0.8),
+    ("search", "search_box", 0.7),
+)
+
+
 class PatternRecognizer(BaseComponent):
     """
     Pattern recognition system for identifying common web patterns.
@@ -16,7 +23,7 @@ class PatternRecognizer(BaseComponent):
     def __init__(self, config: Dict = None):
         """Initialize the pattern recognizer."""
         super().__init__("pattern_recognizer", config)
-        
+    
     def initialize(self) -> bool:
         """Initialize the pattern recognizer."""
         self.is_initialized = True
@@ -28,13 +35,11 @@ class PatternRecognizer(BaseComponent):
     
     def recognize_patterns(self, page_source: str) -> List[Dict[str, Any]]:
         """Recognize patterns in the page source."""
-        patterns = []
+        page_lower = page_source.lower()
         
         # Simple pattern recognition - can be enhanced with ML
-        if "login" in page_source.lower():
-            patterns.append({"type": "login_form", "confidence": 0.8})
-        
-        if "search" in page_source.lower():
-            patterns.append({"type": "search_box", "confidence": 0.7})
-        
-        return patterns
+        return [
+            {"type": pattern_type, "confidence": confidence}
+            for keyword, pattern_type, confidence in PAGE_KEYWORD_PATTERNS
+            if keyword in page_lower
+        ]
@@ -7,14 +7,30 @@ and suggest the most logical next steps in web automation workflows.
 
 import json
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import hashlib
+import heapq
+import asyncio
+import string
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from ..core.base_component import BaseComponent
 
 
+# Outermost JSON object / array embedded in an LLM reply
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+JSON_ARRAY_PATTERN = re.compile(r"\[.*\]", re.DOTALL)
+
+# Strips punctuation so near-identical descriptions compare equal
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+# Lowercased button text containing any of these suggests a workflow-advancing action
+ACTION_BUTTON_PATTERN = re.compile(r"submit|save|continue|next")
+
+
 class StepType(Enum):
     """Types of automation steps."""
     NAVIGATION = "navigation"
@@ -66,6 +82,11 @@ class PageState:
     page_type: str  # login, form, dashboard, listing, etc.
     loading_state: str  # loading, loaded, error
     user_interactions: List[str]  # previous user actions
+    element_ids: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Snapshot of element ids for constant-time availability checks
+        self.element_ids = frozenset(elem.get('id') for elem in self.elements if elem.get('id'))
 
 
 @dataclass
@@ -110,6 +131,19 @@ class SmartNextStepPredictor(BaseComponent):
         self.max_predictions = self.config.get('max_predictions', 5)
         self.min_confidence_threshold = self.config.get('min_confidence_threshold', 0.3)
         self.enable_learning = self.config.get('enable_learning', True)
+        self.response_cache_size = self.config.get('response_cache_size', 256)
+        self.prediction_cache_size = self.config.get('prediction_cache_size', 512)
+        self.prediction_cache_max_elements = self.config.get('prediction_cache_max_elements', 500)
+        self.workflow_beam_width = self.config.get('workflow_beam_width', 1)  # 1 = greedy rollout
+        
+        # LLM responses by exact prompt, least recently used first
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Final predictions by page/goal fingerprint, least recently used first
+        self._prediction_cache: "OrderedDict[Tuple, List[NextStepPrediction]]" = OrderedDict()
+        
+        # Chat calls that came back failed; a prediction pass that saw one isn't cached
+        self._failed_chat_count = 0
         
     def initialize(self) -> bool:
         """Initialize the predictor."""
@@ -136,6 +170,8 @@ class SmartNextStepPredictor(BaseComponent):
             self.pattern_database.clear()
             self.success_patterns.clear()
             self.failure_patterns.clear()
+            self._response_cache.clear()
+            self._prediction_cache.clear()
             
             self.logger.info("Smart Next Step Predictor cleanup completed")
             return True
@@ -166,6 +202,14 @@ class SmartNextStepPredictor(BaseComponent):
             
             max_pred = max_predictions or self.max_predictions
             
+            cache_key = self._prediction_cache_key(page_state, user_goal, max_pred)
+            cached_predictions = self._prediction_cache.get(cache_key) if cache_key else None
+            if cached_predictions is not None:
+                self._prediction_cache.move_to_end(cache_key)
+                return list(cached_predictions)
+            
+            failed_chats_before = self._failed_chat_count
+            
             # Analyze current context
             context_analysis = await self._analyze_context(page_state, user_goal)
             
@@ -188,21 +232,22 @@ class SmartNextStepPredictor(BaseComponent):
             goal_predictions = await self._predict_from_goal_analysis(user_goal, page_state)
             predictions.extend(goal_predictions)
             
-            # Remove duplicates and rank predictions
+            # Remove duplicates, then rank those above the confidence threshold
             unique_predictions = self._deduplicate_predictions(predictions)
             ranked_predictions = await self._rank_predictions(unique_predictions, context_analysis)
             
-            # Filter by confidence threshold
-            filtered_predictions = [
-                p for p in ranked_predictions 
-                if p.confidence_score >= self.min_confidence_threshold
-            ]
-            
             # Return top predictions
-            final_predictions = filtered_predictions[:max_pred]
+            final_predictions = ranked_predictions[:max_pred]
+            
+            # A pass degraded by an LLM outage must not outlive the outage
+            chat_failed = self._failed_chat_count != failed_chats_before
+            if cache_key and self.prediction_cache_size > 0 and not chat_failed:
+                self._prediction_cache[cache_key] = final_predictions
+                while len(self._prediction_cache) > self.prediction_cache_size:
+                    self._prediction_cache.popitem(last=False)
             
             self.logger.info(f"Generated {len(final_predictions)} next step predictions")
-            return final_predictions
+            return list(final_predictions)
             
         except Exception as e:
             self.logger.error(f"Next step prediction failed: {e}")
@@ -228,29 +273,51 @@ class SmartNextStepPredictor(BaseComponent):
         try:
             self.logger.info(f"Predicting complete workflow for: {user_goal.primary_goal}")
             
-            workflow = []
-            current_state = starting_state
+            beam_width = max(1, self.workflow_beam_width)
+            
+            # Partial workflows as (cumulative confidence, steps, simulated state, goal)
+            beam = [(0.0, [], starting_state, user_goal)]
+            completed = []  # (score, steps) that reached the goal
+            dead_ends = []  # (score, steps) that ran out of predictions or steps
             
             for step_num in range(max_steps):
-                # Predict next step
-                next_steps = await self.predict_next_steps(current_state, user_goal, 1)
-                
-                if not next_steps:
-                    break
-                
-                best_step = next_steps[0]
-                workflow.append(best_step)
+                # Predict next steps for every partial workflow at once
+                next_steps_per_entry = await asyncio.gather(*(
+                    self.predict_next_steps(state, goal, beam_width)
+                    for _, _, state, goal in beam
+                ))
                 
-                # Simulate step completion for next prediction
-                current_state = await self._simulate_step_completion(best_step, current_state)
+                candidates = []
+                for (score, steps, state, goal), next_steps in zip(beam, next_steps_per_entry):
+                    if not next_steps:
+                        dead_ends.append((score, steps))
+                        continue
+                    
+                    for next_step in next_steps:
+                        # Simulate step completion for next prediction
+                        next_state = await self._simulate_step_completion(next_step, state)
+                        
+                        # Each branch tracks its own completed steps
+                        next_goal = replace(goal, completed_steps=goal.completed_steps + [next_step.step_id])
+                        candidate = (score + next_step.confidence_score, steps + [next_step], next_state, next_goal)
+                        
+                        # Check if goal is likely achieved
+                        if await self._is_goal_likely_achieved(next_goal, next_state):
+                            completed.append(candidate[:2])
+                        else:
+                            candidates.append(candidate)
                 
-                # Update user goal with completed step
-                user_goal.completed_steps.append(best_step.step_id)
-                
-                # Check if goal is likely achieved
-                if await self._is_goal_likely_achieved(user_goal, current_state):
+                # Prune to the most confident partial workflows
+                beam = heapq.nlargest(beam_width, candidates, key=lambda candidate: candidate[0])
+                if not beam:
                     break
             
+            dead_ends.extend(candidate[:2] for candidate in beam)
+            
+            # Only fall back to an unfinished workflow when no branch reached the goal
+            finished = completed or dead_ends
+            workflow = max(finished, key=lambda result: result[0])[1] if finished else []
+            
             self.logger.info(f"Predicted complete workflow with {len(workflow)} steps")
             return workflow
             
@@ -340,16 +407,15 @@ class SmartNextStepPredictor(BaseComponent):
             if success:
                 # Update success patterns
                 pattern_key = f"{prediction.step_type.value}_{prediction.parameters.get('context', 'general')}"
-                if pattern_key not in self.success_patterns:
-                    self.success_patterns[pattern_key] = []
-                self.success_patterns[pattern_key].append(learning_entry)
+                self.success_patterns.setdefault(pattern_key, []).append(learning_entry)
             else:
                 # Update failure patterns
                 failure_reason = execution_result.get("error", "unknown")
                 pattern_key = f"{prediction.step_type.value}_{failure_reason}"
-                if pattern_key not in self.failure_patterns:
-                    self.failure_patterns[pattern_key] = []
-                self.failure_patterns[pattern_key].append(learning_entry)
+                self.failure_patterns.setdefault(pattern_key, []).append(learning_entry)
+            
+            # Learned patterns feed the predictions, so earlier results are stale
+            self._prediction_cache.clear()
             
             # Update confidence calibration
             await self._update_confidence_calibration(prediction, success)
@@ -361,6 +427,44 @@ class SmartNextStepPredictor(BaseComponent):
     
     # Private helper methods
     
+    def _prediction_cache_key(self, page_state: PageState, user_goal: UserGoal, max_pred: int) -> Optional[Tuple]:
+        """Fingerprint everything the prediction strategies read; None if the page is too large to cache."""
+        if len(page_state.elements) > self.prediction_cache_max_elements:
+            return None
+        
+        return (
+            page_state.url,
+            page_state.title,
+            page_state.page_type,
+            len(page_state.elements),
+            len(page_state.links),
+            tuple((form.get('id'), form.get('name')) for form in page_state.forms),
+            tuple((button.get('id'), button.get('text')) for button in page_state.buttons),
+            user_goal.primary_goal,
+            tuple(user_goal.completed_steps),
+            tuple(user_goal.failed_attempts),
+            max_pred
+        )
+    
+    async def _cached_chat(self, prompt: str) -> Dict[str, Any]:
+        """Ask the chat AI, reusing the response to an identical earlier prompt."""
+        response = self._response_cache.get(prompt)
+        if response is not None:
+            self._response_cache.move_to_end(prompt)
+            return response
+        
+        response = await self.chat_ai.chat(prompt)
+        
+        # Failed chats come back with an error; don't keep serving those
+        if "error" in response:
+            self._failed_chat_count += 1
+        elif self.response_cache_size > 0:
+            self._response_cache[prompt] = response
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+        
+        return response
+    
     async def _analyze_context(self, page_state: PageState, user_goal: UserGoal) -> Dict[str, Any]:
         """Analyze current context using AI."""
         prompt = f"""
@@ -388,10 +492,10 @@ class SmartNextStepPredictor(BaseComponent):
         Return as JSON with structured analysis.
         """
         
-        response = await self.chat_ai.chat(prompt)
+        response = await self._cached_chat(prompt)
         
         try:
-            json_match = re.search(r'\{.*\}', response.get("response", ""), re.DOTALL)
+            json_match = JSON_OBJECT_PATTERN.search(response.get("raw_response", ""))
             if json_match:
                 return json.loads(json_match.group())
         except:
@@ -450,10 +554,10 @@ class SmartNextStepPredictor(BaseComponent):
         Return as JSON array of predictions.
         """
         
-        response = await self.chat_ai.chat(prompt)
+        response = await self._cached_chat(prompt)
         
         try:
-            json_match = re.search(r'\[.*\]', response.get("response", ""), re.DOTALL)
+            json_match = JSON_ARRAY_PATTERN.search(response.get("raw_response", ""))
             if json_match:
                 ai_predictions_data = json.loads(json_match.group())
                 return [self._convert_ai_data_to_prediction(data) for data in ai_predictions_data]
@@ -488,8 +592,7 @@ class SmartNextStepPredictor(BaseComponent):
         # Button-based predictions
         if page_state.buttons:
             for button in page_state.buttons:
-                button_text = button.get('text', '').lower()
-                if any(keyword in button_text for keyword in ['submit', 'save', 'continue', 'next']):
+                if ACTION_BUTTON_PATTERN.search(button.get('text', '').lower()):
                     prediction = NextStepPrediction(
                         step_id=f"click_button_{button.get('id', 'unknown')}",
                         step_type=StepType.CLICK_ACTION,
@@ -514,13 +617,17 @@ class SmartNextStepPredictor(BaseComponent):
         pass
     
     def _deduplicate_predictions(self, predictions: List[NextStepPrediction]) -> List[NextStepPrediction]:
-        """Remove duplicate predictions."""
-        seen_descriptions = set()
+        """Remove duplicate predictions, ignoring case, punctuation and spacing in descriptions."""
+        seen_keys = set()
         unique_predictions = []
         
         for prediction in predictions:
-            if prediction.description not in seen_descriptions:
-                seen_descriptions.add(prediction.description)
+            normalized_description = " ".join(prediction.description.lower().translate(PUNCTUATION_TABLE).split())
+            # LLM replies may list elements as dicts, which aren't hashable
+            required_elements = frozenset(map(str, prediction.required_elements))
+            key = (prediction.step_type, normalized_description, required_elements)
+            if key not in seen_keys:
+                seen_keys.add(key)
                 unique_predictions.append(prediction)
         
         return unique_predictions
@@ -530,14 +637,18 @@ class SmartNextStepPredictor(BaseComponent):
         predictions: List[NextStepPrediction], 
         context_analysis: Dict[str, Any]
     ) -> List[NextStepPrediction]:
-        """Rank predictions by relevance and confidence."""
+        """Rank predictions by relevance and confidence, dropping those below the threshold."""
+        confident_predictions = [p for p in predictions if p.confidence_score >= self.min_confidence_threshold]
+        
         # Sort by confidence score (highest first)
-        return sorted(predictions, key=lambda p: p.confidence_score, reverse=True)
+        return sorted(confident_predictions, key=lambda p: p.confidence_score, reverse=True)
     
     def _convert_ai_data_to_prediction(self, data: Dict[str, Any]) -> NextStepPrediction:
         """Convert AI prediction data to NextStepPrediction object."""
         return NextStepPrediction(
-            step_id=f"ai_pred_{hash(data.get('description', ''))}"[:16],
+            step_id="ai_pred_" + hashlib.blake2b(
+                str(data.get('description', '')).encode('utf-8'), digest_size=6
+            ).hexdigest(),
             step_type=StepType(data.get('step_type', 'click_action')),
             description=data.get('description', 'AI suggested action'),
             confidence=StepConfidence.MEDIUM,
@@ -576,7 +687,7 @@ class SmartNextStepPredictor(BaseComponent):
     
     def _is_element_available(self, element_id: str, current_state: PageState) -> bool:
         """Check if an element is available on the current page."""
-        return any(elem.get('id') == element_id for elem in current_state.elements)
+        return element_id in current_state.element_ids
     
     async def _assess_state_change_impact(self, prediction: NextStepPrediction, current_state: PageState) -> float:
         """Assess impact of state changes on prediction validity."""
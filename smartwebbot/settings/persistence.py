@@ -186,7 +186,7 @@ class SettingsPersistence:
             backup_file = self.backup_dir / f"settings_backup_{timestamp}.yaml"
             
             shutil.copy2(self.settings_file, backup_file)
-            logger.debug(f"Created settings backup: {backup_file}")
+            logger.debug("Created settings backup: %s", backup_file)
             
             # Clean old backups
             self._cleanup_old_backups()
@@ -206,7 +206,7 @@ class SettingsPersistence:
             # Remove excess backups
             for backup_file in backup_files[self.backup_count:]:
                 backup_file.unlink()
-                logger.debug(f"Removed old backup: {backup_file}")
+                logger.debug("Removed old backup: %s", backup_file)
                 
         except Exception as e:
             logger.warning(f"Failed to cleanup old backups: {e}")
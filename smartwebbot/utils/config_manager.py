@@ -7,6 +7,7 @@ Handles configuration loading, validation, and environment-specific settings.
 import os
 import yaml
 import json
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
@@ -453,12 +454,16 @@ class ConfigManager:
 
 # Global configuration manager instance
 _config_manager: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
 
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance."""
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager()
+        # Double-checked so concurrent first calls load the config file only once
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager()
     return _config_manager
 
 def get_config(key: str, default: Any = None) -> Any:
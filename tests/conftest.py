@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the SmartWebBot tests.
+"""
+
+import pytest
+
+from smartwebbot.utils.logger import BotLogger
+
+
+@pytest.fixture(autouse=True, scope="session")
+def log_directory(tmp_path_factory):
+    """Send component logs to a temporary directory instead of the repo's logs/."""
+    log_dir = tmp_path_factory.mktemp("logs")
+
+    BotLogger._initialized = False
+    BotLogger._loggers.clear()
+    BotLogger.initialize({
+        'level': 'INFO',
+        'format': 'detailed',
+        'file_logging': True,
+        'console_logging': False,
+        'json_logging': True,
+        'log_directory': str(log_dir),
+        'max_file_size': 10 * 1024 * 1024,
+        'backup_count': 5,
+        'performance_logging': True
+    })
+    return log_dir
@@ -0,0 +1,134 @@
+"""
+Tests for the intelligent chat orchestrator.
+"""
+
+import asyncio
+
+import pytest
+
+from smartwebbot.intelligence.chat_ai import ChatAI
+from smartwebbot.intelligence.intelligent_chat_orchestrator import (
+    CommandComplexity,
+    IntelligentChatOrchestrator,
+    UserCommand,
+)
+
+
+def make_command(text="login to instagram"):
+    return UserCommand(
+        original_text=text,
+        intent="login_to_platform",
+        target_platform="instagram",
+        action_type="login",
+        complexity=CommandComplexity.MODERATE,
+        required_credentials=(),
+        estimated_steps=3,
+        confidence=0.95,
+        parsed_parameters={}
+    )
+
+
+def test_max_sessions_zero_keeps_one_session():
+    orchestrator = IntelligentChatOrchestrator({"max_sessions": 0})
+
+    assert orchestrator.max_sessions == 1
+
+    orchestrator._get_or_create_context("s1", make_command())
+    context = orchestrator._get_or_create_context("s2", make_command())
+
+    assert list(orchestrator.active_sessions) == ["s2"]
+    assert context.session_id == "s2"
+
+
+def test_sessions_evicted_least_recently_used_first():
+    orchestrator = IntelligentChatOrchestrator({"max_sessions": 2})
+
+    orchestrator._get_or_create_context("s1", make_command())
+    orchestrator._get_or_create_context("s2", make_command())
+    orchestrator._get_or_create_context("s1", make_command())
+    orchestrator._get_or_create_context("s3", make_command())
+
+    assert list(orchestrator.active_sessions) == ["s1", "s3"]
+
+
+def test_failed_step_keeps_earlier_results():
+    orchestrator = IntelligentChatOrchestrator()
+    context = orchestrator._get_or_create_context("s1", make_command())
+    executed = []
+
+    async def execute_step(step, context):
+        executed.append(step["action"])
+        if step["action"] == "click":
+            raise RuntimeError("element not found")
+        return {"status": "success", "action": step["action"]}
+
+    orchestrator._execute_single_step = execute_step
+    plan = [{"action": "navigate"}, {"action": "type"}, {"action": "click"}, {"action": "wait"}]
+
+    result = asyncio.run(orchestrator._execute_workflow(context, plan))
+
+    assert executed == ["navigate", "type", "click"]
+    assert result["type"] == "execution_error"
+    assert [r["action"] for r in result["completed_steps"]] == ["navigate", "type"]
+    assert [entry["step"] for entry in context.execution_history] == [0, 1]
+
+
+def test_cancelled_step_is_not_recorded_as_a_result():
+    orchestrator = IntelligentChatOrchestrator()
+    context = orchestrator._get_or_create_context("s1", make_command())
+
+    async def cancelled_step(step, context):
+        raise asyncio.CancelledError()
+
+    orchestrator._execute_single_step = cancelled_step
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(orchestrator._execute_workflow(context, [{"action": "navigate"}]))
+
+    assert not context.execution_history
+
+
+def test_llm_parameters_survive_chat_response_parsing():
+    orchestrator = IntelligentChatOrchestrator()
+    orchestrator.chat_ai = ChatAI()
+
+    async def reply(system_prompt, user_message):
+        return (
+            'Here is the parsed command:\n'
+            '{"intent": "send_message", "parameters": {"recipient": "alice", "text": "hi"}}'
+        )
+
+    orchestrator.chat_ai._chat_with_ollama = reply
+
+    command = asyncio.run(orchestrator._parse_user_command("tell alice hi"))
+
+    assert command.parsed_parameters == {"recipient": "alice", "text": "hi"}
+
+
+@pytest.mark.parametrize("text, platform", [
+    ("post my photo on ig", "instagram"),
+    ("share this on FB", "facebook"),
+    ("open plus.reconext.com", "plus"),
+    ("upload a tik tok video", "tiktok"),
+    ("sign in to my account", None),
+    ("check the surplus report", None),
+    ("designate a new owner", None),
+])
+def test_platform_keywords_match_whole_words(text, platform):
+    orchestrator = IntelligentChatOrchestrator()
+
+    assert orchestrator._extract_platform(text.lower()) == platform
+
+
+@pytest.mark.parametrize("text, complexity", [
+    ("click the login button", CommandComplexity.SIMPLE),
+    ("please login.", CommandComplexity.SIMPLE),
+    ("try clicking around the page", CommandComplexity.MODERATE),
+    ("run a marketing campaign", CommandComplexity.ADVANCED),
+    ("handle the signup end to end", CommandComplexity.ADVANCED),
+    ("find every review for our product and copy them into the shared sheet", CommandComplexity.COMPLEX),
+])
+def test_complexity_uses_whole_tokens(text, complexity):
+    orchestrator = IntelligentChatOrchestrator()
+
+    assert orchestrator._assess_complexity(text.lower(), "general_automation") == complexity
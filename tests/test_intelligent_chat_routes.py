@@ -0,0 +1,42 @@
+"""
+Tests for the intelligent chat API routes.
+"""
+
+import asyncio
+
+from smartwebbot.api import intelligent_chat_routes
+from smartwebbot.intelligence.chat_ai import ChatAI
+
+
+def test_fallback_ai_does_not_share_history_between_requests(monkeypatch):
+    initialize_calls = []
+
+    def initialize(self):
+        initialize_calls.append(self)
+        return True
+
+    async def reply(self, system_prompt, user_message):
+        return "Reply to " + user_message
+
+    monkeypatch.setattr(intelligent_chat_routes, "fallback_ai_config", None)
+    monkeypatch.setattr(ChatAI, "initialize", initialize)
+    monkeypatch.setattr(ChatAI, "_chat_with_ollama", reply)
+
+    first = intelligent_chat_routes._get_fallback_ai()
+    asyncio.run(first.chat("my password is hunter2"))
+    second = intelligent_chat_routes._get_fallback_ai()
+
+    assert second is not first
+    assert second.is_initialized
+    assert second.get_conversation_history() == []
+    assert len(initialize_calls) == 1
+
+
+def test_fallback_ai_retries_until_the_provider_initializes(monkeypatch):
+    results = iter([False, True])
+
+    monkeypatch.setattr(intelligent_chat_routes, "fallback_ai_config", None)
+    monkeypatch.setattr(ChatAI, "initialize", lambda self: next(results))
+
+    assert intelligent_chat_routes._get_fallback_ai() is None
+    assert intelligent_chat_routes._get_fallback_ai() is not None
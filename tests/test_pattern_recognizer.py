@@ -0,0 +1,22 @@
+"""
+Tests for the pattern recognizer.
+"""
+
+from smartwebbot.intelligence.pattern_recognizer import PatternRecognizer
+
+
+def test_recognizes_keywords_case_insensitively():
+    recognizer = PatternRecognizer()
+
+    patterns = recognizer.recognize_patterns("<form><input name='LOGIN'></form>")
+
+    assert patterns == [{"type": "login_form", "confidence": 0.8}]
+
+
+
+def test_recognizes_every_matching_pattern():
+    recognizer = PatternRecognizer()
+
+    patterns = recognizer.recognize_patterns("<form>Login</form><input placeholder='Search'>")
+
+    assert [pattern["type"] for pattern in patterns] == ["login_form", "search_box"]
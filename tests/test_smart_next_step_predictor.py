@@ -0,0 +1,138 @@
+"""
+Tests for the smart next step predictor.
+"""
+
+import asyncio
+import json
+
+from smartwebbot.intelligence.chat_ai import ChatAI
+from smartwebbot.intelligence.smart_next_step_predictor import (
+    PageState,
+    SmartNextStepPredictor,
+    UserGoal,
+)
+
+
+def make_chat_ai(provider_state):
+    """Real ChatAI with only the provider call stubbed; provider_state["up"] toggles an outage."""
+    chat_ai = ChatAI()
+
+    async def reply(system_prompt, user_message):
+        if not provider_state["up"]:
+            raise ConnectionError("model server unreachable")
+        if "predict the next" in user_message.lower():
+            return "Suggested steps:\n" + json.dumps(
+                [{"step_type": "click_action", "description": "Click submit", "confidence": 0.9}]
+            )
+        return "Analysis:\n" + json.dumps({"progress": "started"})
+
+    chat_ai._chat_with_ollama = reply
+    return chat_ai
+
+
+def make_page_state():
+    return PageState(
+        url="https://example.com/form",
+        title="Form",
+        elements=[],
+        forms=[],
+        buttons=[],
+        links=[],
+        text_content="",
+        page_type="form",
+        loading_state="loaded",
+        user_interactions=[]
+    )
+
+
+def make_user_goal():
+    return UserGoal(
+        primary_goal="submit the form",
+        sub_goals=[],
+        completed_steps=[],
+        failed_attempts=[],
+        time_constraints=None,
+        success_criteria={},
+        user_preferences={}
+    )
+
+
+def test_predictions_from_an_llm_outage_are_not_cached():
+    provider_state = {"up": False}
+    predictor = SmartNextStepPredictor(make_chat_ai(provider_state), web_controller=None)
+
+    during_outage = asyncio.run(predictor.predict_next_steps(make_page_state(), make_user_goal()))
+
+    provider_state["up"] = True
+    after_recovery = asyncio.run(predictor.predict_next_steps(make_page_state(), make_user_goal()))
+
+    assert [p.description for p in during_outage] == []
+    assert [p.description for p in after_recovery] == ["Click submit"]
+
+
+def test_predictions_are_cached_when_every_chat_succeeds():
+    provider_state = {"up": True}
+    predictor = SmartNextStepPredictor(make_chat_ai(provider_state), web_controller=None)
+
+    first = asyncio.run(predictor.predict_next_steps(make_page_state(), make_user_goal()))
+
+    provider_state["up"] = False
+    second = asyncio.run(predictor.predict_next_steps(make_page_state(), make_user_goal()))
+
+    assert [p.description for p in second] == [p.description for p in first] == ["Click submit"]
+
+
+def test_complete_workflow_prefers_branches_that_reach_the_goal():
+    predictor = SmartNextStepPredictor(make_chat_ai({"up": True}), web_controller=None, config={"workflow_beam_width": 2})
+    dead_end = predictor._convert_ai_data_to_prediction({"description": "Open help", "confidence": 0.95})
+    start = predictor._convert_ai_data_to_prediction({"description": "Fill field", "confidence": 0.6})
+
+    async def predict_next_steps(page_state, user_goal, max_predictions=None):
+        if not user_goal.completed_steps:
+            return [dead_end, start]
+        if dead_end.step_id in user_goal.completed_steps:
+            return []
+        return [start]
+
+    predictor.predict_next_steps = predict_next_steps
+
+    workflow = asyncio.run(predictor.predict_complete_workflow(make_page_state(), make_user_goal()))
+
+    assert [step.description for step in workflow] == ["Fill field"] * 5
+
+
+def test_deduplication_accepts_unhashable_required_elements():
+    predictor = SmartNextStepPredictor(make_chat_ai({"up": True}), web_controller=None)
+    data = {"description": "Click submit", "required_elements": [{"id": "submit"}]}
+    predictions = [
+        predictor._convert_ai_data_to_prediction(data),
+        predictor._convert_ai_data_to_prediction(dict(data, description="click submit.")),
+    ]
+
+    unique_predictions = predictor._deduplicate_predictions(predictions)
+
+    assert [p.description for p in unique_predictions] == ["Click submit"]
+
+
+def test_zero_confidence_reply_is_not_treated_as_a_failed_chat():
+    provider_state = {"up": True}
+    chat_ai = make_chat_ai(provider_state)
+    stub_reply = chat_ai._chat_with_ollama
+
+    async def reply(system_prompt, user_message):
+        if provider_state["up"] and "predict the next" in user_message.lower():
+            return json.dumps([
+                {"step_type": "click_action", "description": "Click submit", "confidence": 0.9},
+                {"step_type": "scroll", "description": "Scroll down", "confidence": 0}
+            ])
+        return await stub_reply(system_prompt, user_message)
+
+    chat_ai._chat_with_ollama = reply
+    predictor = SmartNextStepPredictor(chat_ai, web_controller=None)
+
+    first = asyncio.run(predictor.predict_next_steps(make_page_state(), make_user_goal()))
+
+    provider_state["up"] = False
+    second = asyncio.run(predictor.predict_next_steps(make_page_state(), make_user_goal()))
+
+    assert [p.description for p in second] == [p.description for p in first] == ["Click submit"]